@@ -6,12 +6,27 @@ that preserves structural integrity while enabling seamless content modification
 through an intermediate representation.
 """
 
+from typing import TYPE_CHECKING
+
 from htmladapt.__version__ import __version__
 from htmladapt.config import ProcessingConfig
-from htmladapt.tool import HTMLExtractMergeTool
+
+if TYPE_CHECKING:
+    from htmladapt.tool import HTMLExtractMergeTool
 
 __all__ = [
     "HTMLExtractMergeTool",
     "ProcessingConfig",
     "__version__",
 ]
+
+
+def __getattr__(name: str) -> object:
+    """Import the tool on first access so light imports skip bs4 and numpy."""
+    if name == "HTMLExtractMergeTool":
+        from htmladapt.tool import HTMLExtractMergeTool  # noqa: PLC0415
+
+        return HTMLExtractMergeTool
+
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
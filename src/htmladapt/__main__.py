@@ -8,17 +8,16 @@ Simple command-line interface for HTML content extraction and merging.
 import sys
 from pathlib import Path
 
-import fire
-
-from htmladapt import HTMLExtractMergeTool, ProcessingConfig
+from htmladapt import ProcessingConfig
 from htmladapt.__version__ import __version__
 
 
 class HTMLAdaptCLI:
     """HTMLAdapt command-line interface."""
 
-    def version(self) -> None:
+    def version(self) -> str:
         """Display version information."""
+        return __version__
 
     def extract(
         self,
@@ -37,17 +36,18 @@ class HTMLAdaptCLI:
         """
         full_path = Path(full_path)
 
-        if not full_path.exists():
-            sys.exit(1)
-
         # Set default new_path paths if not provided
-        if map_path is None:
-            map_path = full_path.with_suffix(".m.html")
-        if comp_path is None:
-            comp_path = full_path.with_suffix(".c.html")
+        map_path = full_path.with_suffix(".m.html") if map_path is None else Path(map_path)
+        comp_path = full_path.with_suffix(".c.html") if comp_path is None else Path(comp_path)
 
-        map_path = Path(map_path)
-        comp_path = Path(comp_path)
+        # Reading fails on a missing file, so no separate exists() check is needed
+        try:
+            html_content = full_path.read_bytes()
+        except OSError:
+            sys.exit(1)
+
+        # Deferred so `version` and --help do not load bs4 and numpy
+        from htmladapt import HTMLExtractMergeTool  # noqa: PLC0415
 
         # Create configuration
         config = ProcessingConfig(id_prefix=id_prefix)
@@ -56,12 +56,10 @@ class HTMLAdaptCLI:
         tool = HTMLExtractMergeTool(config=config)
 
         try:
-            html_content = full_path.read_text(encoding="utf-8")
-
             map_html, comp_html = tool.extract(html_content)
 
-            map_path.write_text(map_html, encoding="utf-8")
-            comp_path.write_text(comp_html, encoding="utf-8")
+            map_path.write_bytes(map_html.encode("utf-8"))
+            comp_path.write_bytes(comp_html.encode("utf-8"))
 
         except Exception:
             sys.exit(1)
@@ -92,15 +90,24 @@ class HTMLAdaptCLI:
         map_path = Path(map_path)
         old_path = Path(old_path)
 
-        # Check all input files exist
-        for path in [cnew_path, cold_path, map_path, old_path]:
-            if not path.exists():
-                sys.exit(1)
-
         # Set default new_path path if not provided
-        if new_path is None:
-            new_path = old_path.with_suffix(".n.html")
-        new_path = Path(new_path)
+        new_path = old_path.with_suffix(".n.html") if new_path is None else Path(new_path)
+
+        # Imported here because merge is the only command that needs it
+        from concurrent.futures import ThreadPoolExecutor  # noqa: PLC0415
+
+        # Reading fails on a missing file, so no separate exists() checks are needed.
+        # File reads release the GIL, so the four inputs are read concurrently.
+        try:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                cnew_html, cold_html, map_html, old_html = executor.map(
+                    Path.read_bytes, [cnew_path, cold_path, map_path, old_path]
+                )
+        except OSError:
+            sys.exit(1)
+
+        # Deferred so `version` and --help do not load bs4 and numpy
+        from htmladapt import HTMLExtractMergeTool  # noqa: PLC0415
 
         # Create configuration
         config = ProcessingConfig(
@@ -112,14 +119,9 @@ class HTMLAdaptCLI:
         tool = HTMLExtractMergeTool(config=config)
 
         try:
-            cnew_html = cnew_path.read_text(encoding="utf-8")
-            cold_html = cold_path.read_text(encoding="utf-8")
-            map_html = map_path.read_text(encoding="utf-8")
-            old_html = old_path.read_text(encoding="utf-8")
-
             new_html = tool.merge(cnew_html, cold_html, map_html, old_html)
 
-            new_path.write_text(new_html, encoding="utf-8")
+            new_path.write_bytes(new_html.encode("utf-8"))
 
         except Exception:
             sys.exit(1)
@@ -127,6 +129,9 @@ class HTMLAdaptCLI:
 
 def main() -> None:
     """Main CLI entry point."""
+    # Deferred so importing this module does not load fire
+    import fire  # noqa: PLC0415
+
     try:
         fire.Fire(HTMLAdaptCLI)
     except KeyboardInterrupt:
@@ -4,12 +4,12 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ProcessingConfig:
     """Configuration settings for HTMLAdapt processing.
 
     This class defines configurable parameters for HTML extraction,
-    matching, and merging operations.
+    matching, and merging operations. Instances are immutable and hashable.
 
     Attributes:
         id_prefix: Prefix for generated element IDs
@@ -5,6 +5,8 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+_BASE36_DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+
 
 class IDGenerator:
     """Generates unique, collision-free IDs for HTML elements.
@@ -62,6 +64,15 @@ class IDGenerator:
         self._used_ids.add(existing_id)
         logger.debug(f"Registered existing ID: {existing_id}")
 
+    def register_existing_ids(self, existing_ids: list[str]) -> None:
+        """Register several existing IDs at once to avoid collisions.
+
+        Args:
+            existing_ids: IDs that already exist in the document
+        """
+        self._used_ids.update(existing_ids)
+        logger.debug("Registered %d existing IDs", len(existing_ids))
+
     def is_generated_id(self, element_id: str) -> bool:
         """Check if an ID was generated by this generator.
 
@@ -88,17 +99,15 @@ class IDGenerator:
         Returns:
             Base36 string representation
         """
-        if num == 0:
-            return "0"
-
-        digits = "0123456789abcdefghijklmnopqrstuvwxyz"
-        result = ""
+        if num < len(_BASE36_DIGITS):
+            return _BASE36_DIGITS[num]
 
+        digits = []
         while num > 0:
-            result = digits[num % 36] + result
-            num //= 36
+            num, remainder = divmod(num, 36)
+            digits.append(_BASE36_DIGITS[remainder])
 
-        return result
+        return "".join(reversed(digits))
 
     @property
     def stats(self) -> dict[str, int]:
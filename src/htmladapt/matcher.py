@@ -3,13 +3,29 @@
 
 import hashlib
 import logging
+from collections import deque
+from typing import TYPE_CHECKING
 
 from bs4 import NavigableString, Tag
 
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
 try:
-    from rapidfuzz import fuzz
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from rapidfuzz import fuzz, process
 except ImportError:
     fuzz = None
+    process = None
+
+try:
+    import scipy
+except ImportError:
+    scipy = None
 
 try:
     import xxhash
@@ -18,6 +34,9 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Confidence assigned to elements matched by identical content hash
+HASH_MATCH_SCORE = 0.95
+
 
 class ElementMatcher:
     """Multi-strategy element matching for HTML reconciliation.
@@ -33,7 +52,6 @@ class ElementMatcher:
             simi_level: Minimum similarity score for fuzzy matching
         """
         self.simi_level = simi_level
-        self._content_cache: dict[str, str] = {}
 
     def match_elements(
         self, edited_elements: list[Tag], original_elements: list[Tag]
@@ -48,28 +66,55 @@ class ElementMatcher:
             List of tuples: (edited_element, original_element, confidence_score)
             None values indicate unmatched elements
         """
-        matches = []
-        used_old_pacompal_indices = set()
-
-        for edited_elem in edited_elements:
-            best_match = None
-            best_score = 0.0
-            best_old_pacompal_idx = -1
-
-            for idx, original_elem in enumerate(original_elements):
-                if idx in used_old_pacompal_indices:
-                    continue
-
-                score = self._calculate_similarity(edited_elem, original_elem)
-
-                if score > best_score and score >= self.simi_level:
-                    best_match = original_elem
-                    best_score = score
-                    best_old_pacompal_idx = idx
-
-            if best_match is not None:
-                matches.append((edited_elem, best_match, best_score))
+        used_old_pacompal_indices: set[int] = set()
+        best_matches: list[tuple[int, float]] = []
+
+        # Per-element match keys are computed once, not once per compared pair
+        edited_ids, edited_texts, edited_hashes = self._prepare(edited_elements)
+        original_ids, original_texts, original_hashes = self._prepare(original_elements)
+
+        # Originals are indexed by ID and hash so exact matches are lookups, not scans
+        id_index: dict[str, deque[int]] = {}
+        hash_index: dict[int, deque[int]] = {}
+        for idx, (original_id, original_hash) in enumerate(zip(original_ids, original_hashes, strict=True)):
+            if original_id:
+                id_index.setdefault(original_id, deque()).append(idx)
+            hash_index.setdefault(original_hash, deque()).append(idx)
+
+        for edited_id, edited_hash in zip(edited_ids, edited_hashes, strict=True):
+            best_old_pacompal_idx, best_score = self._find_exact_match(
+                edited_id, edited_hash, id_index, hash_index, used_old_pacompal_indices
+            )
+            if best_old_pacompal_idx >= 0:
                 used_old_pacompal_indices.add(best_old_pacompal_idx)
+            best_matches.append((best_old_pacompal_idx, best_score))
+
+        # Unchanged text is paired by lookup; fuzzy scoring would rate it 1.0 anyway
+        unmatched_rows = [row for row, (idx, _) in enumerate(best_matches) if idx < 0]
+        if unmatched_rows:
+            text_index: dict[str, deque[int]] = {}
+            for idx, text in enumerate(original_texts):
+                if text and idx not in used_old_pacompal_indices:
+                    text_index.setdefault(text, deque()).append(idx)
+            for row in unmatched_rows:
+                idx = self._first_unused(text_index.get(edited_texts[row]), used_old_pacompal_indices)
+                if idx >= 0:
+                    used_old_pacompal_indices.add(idx)
+                    best_matches[row] = (idx, 1.0)
+            unmatched_rows = [row for row in unmatched_rows if best_matches[row][0] < 0]
+
+        # Remaining elements are scored together in one batch
+        if unmatched_rows:
+            fuzzy_matches = self._find_fuzzy_matches(
+                edited_texts, original_texts, unmatched_rows, used_old_pacompal_indices
+            )
+            for row, match in fuzzy_matches.items():
+                best_matches[row] = match
+
+        matches: list[tuple[Tag | None, Tag | None, float]] = []
+        for edited_elem, (idx, score) in zip(edited_elements, best_matches, strict=True):
+            if idx >= 0:
+                matches.append((edited_elem, original_elements[idx], score))
             else:
                 matches.append((edited_elem, None, 0.0))
 
@@ -80,135 +125,235 @@ class ElementMatcher:
 
         return matches
 
-    def _calculate_similarity(self, elem1: Tag, elem2: Tag) -> float:
-        """Calculate similarity score between two elements.
+    def _prepare(self, elements: list[Tag]) -> tuple[list[str | None], list[str], list[int]]:
+        """Compute the match keys of each element in one pass.
 
         Args:
-            elem1: First element
-            elem2: Second element
+            elements: Elements to prepare
 
         Returns:
-            Similarity score between 0.0 and 1.0
+            Parallel lists of ID attributes, normalized texts and content hashes
         """
-        # 1. Perfect ID match (highest priority)
-        if self._id_similarity(elem1, elem2) == 1.0:
-            return 1.0
-
-        # 2. Hash-based content match
-        if self._hash_similarity(elem1, elem2) == 1.0:
-            return 0.95
-
-        # 3. Fuzzy text similarity
-        return self._text_similarity(elem1, elem2)
-
-    def _id_similarity(self, elem1: Tag, elem2: Tag) -> float:
-        """Calculate ID-based similarity.
+        ids: list[str | None] = []
+        texts: list[str] = []
+        hashes: list[int] = []
+        for element in elements:
+            text = self._get_element_text(element)
+            ids.append(element.get("id"))
+            texts.append(text)
+            hashes.append(self._get_content_hash(element, text))
+        return ids, texts, hashes
+
+    def _find_exact_match(
+        self,
+        edited_id: str | None,
+        edited_hash: int,
+        id_index: dict[str, deque[int]],
+        hash_index: dict[int, deque[int]],
+        used_indices: set[int],
+    ) -> tuple[int, float]:
+        """Find the first unused original matching by ID, then by content hash.
 
         Args:
-            elem1: First element
-            elem2: Second element
+            edited_id: ID attribute of the edited element
+            edited_hash: Content hash of the edited element
+            id_index: Original indices grouped by ID attribute, in document order
+            hash_index: Original indices grouped by content hash, in document order
+            used_indices: Indices of originals that are already matched
 
         Returns:
-            1.0 if IDs match exactly, 0.0 otherwise
+            Tuple of (original index or -1, confidence score)
         """
-        id1 = elem1.get("id")
-        id2 = elem2.get("id")
+        if edited_id:
+            idx = self._first_unused(id_index.get(edited_id), used_indices)
+            if idx >= 0:
+                return idx, 1.0
+
+        if self.simi_level <= HASH_MATCH_SCORE:
+            idx = self._first_unused(hash_index.get(edited_hash), used_indices)
+            if idx >= 0:
+                return idx, HASH_MATCH_SCORE
 
-        if id1 and id2 and id1 == id2:
-            return 1.0
+        return -1, 0.0
 
-        return 0.0
+    def _first_unused(self, candidates: deque[int] | None, used_indices: set[int]) -> int:
+        """Return the first candidate index that is not yet used.
 
-    def _hash_similarity(self, elem1: Tag, elem2: Tag) -> float:
-        """Calculate hash-based content similarity.
+        Used indices stay used, so they are dropped from the front of the queue.
 
         Args:
-            elem1: First element
-            elem2: Second element
+            candidates: Original indices sharing a match key, or None
+            used_indices: Indices of originals that are already matched
 
         Returns:
-            1.0 if content hashes match, 0.0 otherwise
+            Original index, or -1 if every candidate is used
         """
-        hash1 = self._get_content_hash(elem1)
-        hash2 = self._get_content_hash(elem2)
-
-        return 1.0 if hash1 == hash2 else 0.0
-
-    def _text_similarity(self, elem1: Tag, elem2: Tag) -> float:
-        """Calculate text-based fuzzy similarity.
+        while candidates:
+            if candidates[0] not in used_indices:
+                return candidates[0]
+            candidates.popleft()
+        return -1
+
+    def _find_fuzzy_matches(
+        self,
+        edited_texts: list[str],
+        original_texts: list[str],
+        edited_rows: list[int],
+        used_indices: set[int],
+    ) -> dict[int, tuple[int, float]]:
+        """Match the given edited elements to unused originals by text similarity.
+
+        Pairs are chosen by an optimal assignment that maximizes the total
+        similarity. Without scipy, edited elements are assigned greedily in
+        document order, each taking the most similar original that is still unused.
 
         Args:
-            elem1: First element
-            elem2: Second element
+            edited_texts: Normalized text of each edited element
+            original_texts: Normalized text of each original element
+            edited_rows: Indices of edited elements to match
+            used_indices: Indices of originals that are already matched; updated in place
 
         Returns:
-            Fuzzy similarity score between 0.0 and 1.0
+            Mapping of edited index to (original index, confidence score)
         """
-        if fuzz is None:
-            logger.warning("rapidfuzz not available, using simple text matching")
-            return self._simple_text_similarity(elem1, elem2)
-
-        text1 = self._get_element_text(elem1)
-        text2 = self._get_element_text(elem2)
-
-        if not text1 or not text2:
-            return 0.0
+        rows = [row for row in edited_rows if edited_texts[row]]
+        cols = [idx for idx, text in enumerate(original_texts) if text and idx not in used_indices]
+        fuzzy_matches: dict[int, tuple[int, float]] = {}
 
-        # Use rapidfuzz for accurate fuzzy matching
-        return fuzz.ratio(text1, text2) / 100.0
+        if not rows or not cols:
+            return fuzzy_matches
 
-    def _simple_text_similarity(self, elem1: Tag, elem2: Tag) -> float:
-        """Simple text similarity fallback when rapidfuzz is not available.
+        if process is None or np is None:
+            logger.warning("rapidfuzz not available, using simple text matching")
+            # Each text is tokenized once, not once per compared pair
+            original_words = {idx: frozenset(original_texts[idx].lower().split()) for idx in cols}
+            for row in rows:
+                best_idx = -1
+                best_score = 0.0
+                edited_words = frozenset(edited_texts[row].lower().split())
+                for idx in cols:
+                    if idx in used_indices:
+                        continue
+                    words = original_words[idx]
+                    # Word overlap cannot exceed the ratio of the smaller word set to the larger
+                    if min(len(edited_words), len(words)) < self.simi_level * max(len(edited_words), len(words)):
+                        continue
+                    score = self._simple_text_similarity(edited_words, words)
+                    if score > best_score and score >= self.simi_level:
+                        best_idx = idx
+                        best_score = score
+                if best_idx >= 0:
+                    used_indices.add(best_idx)
+                    fuzzy_matches[row] = (best_idx, best_score)
+            return fuzzy_matches
+
+        # Repeated strings such as navigation labels are scored once, then
+        # expanded back to one row and column per element
+        unique_edited, edited_positions = self._unique_texts([edited_texts[row] for row in rows])
+        unique_original, original_positions = self._unique_texts([original_texts[idx] for idx in cols])
+
+        # One multi-threaded C call scores every pair; pairs below the cutoff come back as 0
+        unique_scores = process.cdist(
+            unique_edited,
+            unique_original,
+            scorer=fuzz.ratio,
+            processor=None,
+            score_cutoff=self.simi_level * 100,
+            dtype=np.float32,
+            workers=-1,
+        )
+        scores = unique_scores[np.ix_(edited_positions, original_positions)]
+
+        for i, col in self._assign(scores):
+            score = float(scores[i, col])
+            if score > 0:
+                used_indices.add(cols[col])
+                fuzzy_matches[rows[i]] = (cols[col], score / 100.0)
+
+        return fuzzy_matches
+
+    def _unique_texts(self, texts: list[str]) -> tuple[list[str], list[int]]:
+        """Deduplicate texts while keeping first-seen order.
 
         Args:
-            elem1: First element
-            elem2: Second element
+            texts: Texts that may contain repeats
 
         Returns:
-            Simple similarity score
+            Tuple of (unique texts, position of each input text in the unique list)
         """
-        text1 = self._get_element_text(elem1)
-        text2 = self._get_element_text(elem2)
+        positions: dict[str, int] = {}
+        for text in texts:
+            positions.setdefault(text, len(positions))
+        return list(positions), [positions[text] for text in texts]
 
-        if text1 == text2:
-            return 1.0
-        if text1 and text2:
-            # Simple Jaccard similarity on words
-            words1 = set(text1.lower().split())
-            words2 = set(text2.lower().split())
+    def _assign(self, scores: "npt.NDArray[np.float32]") -> list[tuple[int, int]]:
+        """Pair rows and columns of a score matrix, each used at most once.
 
-            if not words1 and not words2:
-                return 1.0
+        Args:
+            scores: Similarity matrix of edited rows by original columns
+
+        Returns:
+            List of (row, column) pairs in row order
+        """
+        if scipy is not None:
+            # scipy.optimize is imported on first use: it takes longer to load
+            # than most merges take to run, and many merges never get here
+            from scipy.optimize import linear_sum_assignment  # noqa: PLC0415
+
+            row_ind, col_ind = linear_sum_assignment(scores, maximize=True)
+            return list(zip(row_ind.tolist(), col_ind.tolist(), strict=True))
+
+        pairs = []
+        taken = np.zeros(scores.shape[1], dtype=bool)
+        for i in range(scores.shape[0]):
+            row_scores = np.where(taken, 0.0, scores[i])
+            col = int(row_scores.argmax())
+            if row_scores[col] > 0:
+                taken[col] = True
+                pairs.append((i, col))
+        return pairs
+
+    def _simple_text_similarity(self, words1: frozenset[str], words2: frozenset[str]) -> float:
+        """Simple text similarity fallback when rapidfuzz is not available.
 
-            intersection = words1 & words2
-            union = words1 | words2
+        Args:
+            words1: Lowercased words of the first text
+            words2: Lowercased words of the second text
 
-            return len(intersection) / len(union) if union else 0.0
+        Returns:
+            Jaccard similarity of the word sets
+        """
+        intersection = len(words1 & words2)
+        union = len(words1) + len(words2) - intersection
 
-        return 0.0
+        return intersection / union if union else 0.0
 
-    def _get_content_hash(self, element: Tag) -> str:
+    def _get_content_hash(self, element: Tag, content: str) -> int:
         """Generate content hash for an element.
 
         Args:
             element: Element to hash
+            content: Normalized text content of the element
 
         Returns:
-            Content hash string
+            Content hash, only meaningful for equality comparison
         """
-        element_id = id(element)
-        if element_id in self._content_cache:
-            return self._content_cache[element_id]
-
-        # Get normalized content for hashing
-        content = self._get_element_text(element)
-        tag_info = f"{element.name}:{element.attrs}"
-        hash_input = f"{tag_info}|{content}".encode()
-
-        content_hash = xxhash.xxh64(hash_input).hexdigest() if xxhash else hashlib.sha256(hash_input).hexdigest()[:16]
-
-        self._content_cache[element_id] = content_hash
-        return content_hash
+        name = element.name.encode()
+        attrs = repr(sorted(element.attrs.items())).encode()
+        text = content.encode()
+
+        if xxhash:
+            xxh = xxhash.xxh3_64(name)
+            xxh.update(attrs)
+            xxh.update(b"|")
+            xxh.update(text)
+            return xxh.intdigest()
+
+        blake = hashlib.blake2b(name, digest_size=8)
+        blake.update(attrs)
+        blake.update(b"|")
+        blake.update(text)
+        return int.from_bytes(blake.digest(), "little")
 
     def _get_element_text(self, element: Tag) -> str:
         """Extract normalized text content from element.
@@ -225,5 +370,8 @@ class ElementMatcher:
         return " ".join(text.split())
 
     def clear_cache(self) -> None:
-        """Clear the content cache."""
-        self._content_cache.clear()
+        """Clear cached match data.
+
+        Match keys are computed per call and not cached, so this does nothing.
+        It is kept for callers of the earlier API.
+        """
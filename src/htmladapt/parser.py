@@ -1,52 +1,89 @@
 # this_file: src/htmladapt/parser.py
 """HTML parsing with multiple backend support and fallback mechanisms."""
 
+import codecs
+import copy
 import logging
 
 from bs4 import BeautifulSoup
+from bs4.builder import builder_registry
 
 logger = logging.getLogger(__name__)
 
+# Byte-order marks identify an encoding without sniffing; unmarked bytes are read as UTF-8
+_BOM_ENCODINGS = (
+    (codecs.BOM_UTF8, "utf-8"),
+    (codecs.BOM_UTF16_LE, "utf-16-le"),
+    (codecs.BOM_UTF16_BE, "utf-16-be"),
+)
+
 
 class HTMLParser:
     """Simple HTML parser with automatic fallback."""
 
+    __slots__ = ("_preferred_parsers",)
+
     def __init__(self) -> None:
         """Initialize the parser."""
-        self._preferred_parsers = ["lxml", "html5lib", "html.parser"]
+        # Builders that are not installed are left out once here, not on every parse
+        self._preferred_parsers = [
+            name for name in ("lxml", "html5lib", "html.parser") if builder_registry.lookup(name) is not None
+        ]
 
     def parse(self, content: str | bytes, encoding: str | None = None) -> BeautifulSoup:
         """Parse HTML content using the first available parser.
 
         Args:
             content: HTML content to parse
-            encoding: Character encoding to use for bytes content
+            encoding: Character encoding to use for bytes content; defaults to
+                the encoding of a leading byte-order mark, otherwise UTF-8
 
         Returns:
             BeautifulSoup: Parsed HTML tree
 
         Raises:
-            ValueError: If all parsing attempts fail
+            ValueError: If bytes content without a byte-order mark or explicit
+                encoding is not valid UTF-8, or if all parsing attempts fail
         """
+        from_encoding = None
         if isinstance(content, bytes):
-            content = content.decode(encoding) if encoding else content.decode("utf-8", errors="replace")
+            # Hand raw bytes to the tree builder with a known encoding so lxml
+            # decodes them in C and BeautifulSoup skips encoding sniffing.
+            if encoding:
+                from_encoding = codecs.lookup(encoding).name
+            else:
+                from_encoding = next((name for bom, name in _BOM_ENCODINGS if content.startswith(bom)), None)
+                if from_encoding is None:
+                    # Builders disagree on undecodable bytes: lxml and html5lib
+                    # substitute U+FFFD and html.parser guesses windows-1252.
+                    # Reject them instead, as decoding to str up front did.
+                    from_encoding = "utf-8"
+                    if not content.isascii():
+                        try:
+                            content.decode(from_encoding)
+                        except UnicodeDecodeError as error:
+                            msg = f"Content is not valid UTF-8 and no encoding was given: {error}"
+                            raise ValueError(msg) from error
 
         for parser_name in self._preferred_parsers:
             try:
-                soup = BeautifulSoup(content, parser_name)
+                soup = BeautifulSoup(content, parser_name, from_encoding=from_encoding)
                 soup._htmladapt_parser = parser_name
                 return soup
             except Exception:
                 continue
 
         # Fallback to basic parser
-        soup = BeautifulSoup(content, "html.parser")
+        soup = BeautifulSoup(content, "html.parser", from_encoding=from_encoding)
         soup._htmladapt_parser = "html.parser"
         return soup
 
     def clone_soup(self, soup: BeautifulSoup) -> BeautifulSoup:
-        """Clone a soup object using the same parser that created it."""
+        """Clone a soup object using the same parser that created it.
+
+        The tree is deep-copied node by node rather than serialized and reparsed.
+        """
         parser_name = getattr(soup, "_htmladapt_parser", "html.parser")
-        clone = BeautifulSoup(str(soup), parser_name)
+        clone = copy.copy(soup)
         clone._htmladapt_parser = parser_name
         return clone
@@ -3,7 +3,8 @@
 
 import logging
 
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, NavigableString, Tag
+from bs4.dammit import EntitySubstitution
 
 from htmladapt.config import ProcessingConfig
 from htmladapt.id_generation import IDGenerator
@@ -12,6 +13,12 @@ from htmladapt.parser import HTMLParser
 
 logger = logging.getLogger(__name__)
 
+# Document skeleton tags wrap the whole subset; they are only translatable entries when extracted with an ID
+_DOCUMENT_TAGS = frozenset({"html", "head", "body"})
+
+# Elements whose text is never offered for translation
+_NON_TRANSLATABLE_TAGS = frozenset({"script", "style", "meta", "link", "head", "title"})
+
 
 class HTMLExtractMergeTool:
     """Main tool for HTML content extraction and merging.
@@ -35,14 +42,14 @@ class HTMLExtractMergeTool:
 
         logger.info("Initialized HTMLExtractMergeTool")
 
-    def extract(self, html: str) -> tuple[str, str]:
+    def extract(self, html: str | bytes) -> tuple[str, str]:
         """Extract content from HTML document.
 
         Creates both a superset document (original with IDs) and subset document
         (translatable content only) for later merging.
 
         Args:
-            html: Original HTML content
+            html: Original HTML content; bytes are decoded as UTF-8 unless they start with a byte-order mark
 
         Returns:
             Tuple of (map_html, comp_html)
@@ -53,17 +60,17 @@ class HTMLExtractMergeTool:
             # Parse the original HTML
             original_soup = self.parser.parse(html)
 
-            # Register existing IDs to avoid collisions
-            self._register_existing_ids(original_soup)
+            # Register existing IDs and find text-containing elements in one walk
+            text_elements = self._scan_elements(original_soup)
 
-            # Create superset: original HTML with added IDs
-            full_soup = self._create_superset(original_soup)
+            # Create superset: original HTML with added IDs. The parsed tree is
+            # private to this call, so IDs are added in place rather than on a copy.
+            full_soup = self._create_superset(original_soup, text_elements)
 
             # Create subset: translatable content only
-            comp_soup = self._create_subset(full_soup)
+            comp_html = self._create_subset(full_soup, text_elements)
 
             map_html = str(full_soup)
-            comp_html = str(comp_soup)
 
             logger.info(f"Extraction complete. Superset: {len(map_html)} chars, Subset: {len(comp_html)} chars")
 
@@ -73,35 +80,44 @@ class HTMLExtractMergeTool:
             logger.error("Extraction failed: %s", error)
             raise
 
-    def merge(self, cnew_path: str, cold_path: str, superset: str, original: str) -> str:
+    def merge(
+        self, cnew_path: str | bytes, cold_path: str | bytes, superset: str | bytes, original: str | bytes
+    ) -> str:
         """Merge edited content back into the original structure.
 
+        Bytes inputs are decoded as UTF-8 unless they start with a byte-order mark.
+
         Args:
             cnew_path: Edited subset content
             cold_path: Original subset for comparison
             superset: Original with IDs (superset document)
-            original: Original HTML document
+            original: Original HTML document; the superset already carries its
+                structure, so it is accepted for API compatibility but not parsed
 
         Returns:
             Final merged HTML document
         """
+        del original  # accepted for API compatibility; the superset carries the structure
         logger.info("Starting HTML merge process")
 
         try:
-            # Parse all inputs
+            # Parse all inputs. An unedited subset is parsed only once; neither
+            # subset tree is modified below, so both sides can share it.
             edited_soup = self.parser.parse(cnew_path)
-            original_comp_soup = self.parser.parse(cold_path)
+            original_comp_soup = edited_soup if cold_path == cnew_path else self.parser.parse(cold_path)
             full_soup = self.parser.parse(superset)
-            self.parser.parse(original)
 
             # Match elements between edited and original subsets
             matches = self._match_comp_elements(edited_soup, original_comp_soup)
 
+            # Elements carrying an ID are collected once for both lookup and cleanup
+            id_elements = full_soup.find_all(id=True)
+
             # Apply changes to superset
-            merged_soup = self._apply_changes_to_superset(matches, full_soup)
+            merged_soup = self._apply_changes_to_superset(matches, full_soup, id_elements)
 
             # Clean up generated IDs (optional, based on config)
-            final_soup = self._cleanup_generated_ids(merged_soup)
+            final_soup = self._cleanup_generated_ids(merged_soup, id_elements)
 
             result_html = str(final_soup)
 
@@ -113,64 +129,83 @@ class HTMLExtractMergeTool:
             logger.error("Merge failed: %s", error)
             raise
 
-    def _register_existing_ids(self, soup: BeautifulSoup) -> None:
-        """Register existing element IDs to avoid collisions.
+    def _scan_elements(self, soup: BeautifulSoup) -> list[Tag]:
+        """Register existing element IDs and collect text-containing elements.
+
+        All existing IDs are registered before any new ID is generated, so
+        generated IDs cannot collide with IDs later in the document.
 
         Args:
             soup: Parsed HTML document
+
+        Returns:
+            Text-containing elements in document order
         """
-        for element in soup.find_all(attrs={"id": True}):
-            self.id_generator.register_existing_id(element["id"])
+        existing_ids = []
+        text_elements = []
+        for element in soup.find_all():
+            if "id" in element.attrs:
+                existing_ids.append(element["id"])
+            if self._is_text_containing_element(element):
+                text_elements.append(element)
+
+        self.id_generator.register_existing_ids(existing_ids)
+        return text_elements
 
-    def _create_superset(self, soup: BeautifulSoup) -> BeautifulSoup:
+    def _create_superset(self, soup: BeautifulSoup, text_elements: list[Tag]) -> BeautifulSoup:
         """Create superset document by adding IDs to text-containing elements.
 
+        The document is modified in place; callers that need the original tree
+        unchanged should pass a copy (see HTMLParser.clone_soup).
+
         Args:
             soup: Original parsed document
+            text_elements: Text-containing elements of the document
 
         Returns:
             Superset document with IDs
         """
-        # Make a copy to avoid modifying the original
-        full_soup = self.parser.clone_soup(soup)
+        for element in text_elements:
+            if not element.get("id"):
+                element["id"] = self.id_generator.generate_id(element.name)
 
-        for element in full_soup.find_all():
-            if self._is_text_containing_element(element):
-                if not element.get("id"):
-                    element["id"] = self.id_generator.generate_id(element.name)
-
-        return full_soup
+        return soup
 
-    def _create_subset(self, full_soup: BeautifulSoup) -> BeautifulSoup:
+    def _create_subset(self, full_soup: BeautifulSoup, text_elements: list[Tag]) -> str:
         """Create subset document with only translatable content.
 
+        The subset is a flat list of leaf elements, so it is written out as HTML
+        directly, escaped the way BeautifulSoup's default formatter would.
+
         Args:
             full_soup: Superset document with IDs
+            text_elements: Text-containing elements of the superset
 
         Returns:
-            Subset document with translatable content
+            Subset document HTML with translatable content
         """
-        # Start with minimal HTML structure
+        # Start with the minimal HTML structure the document's parser produces
         parser_name = getattr(full_soup, "_htmladapt_parser", "html.parser")
-        comp_soup = BeautifulSoup("<html><body></body></html>", parser_name)
-        comp_soup._htmladapt_parser = parser_name
-        body = comp_soup.body
+        skeleton = str(BeautifulSoup("<html><body></body></html>", parser_name))
+        before_body_end, after_body_end = skeleton.rsplit("</body>", 1)
 
-        for element in full_soup.find_all():
+        fragments = [before_body_end]
+        for element in text_elements:
             if self._is_translatable_element(element):
-                # Create a copy of the element with its ID
-                new_elem = comp_soup.new_tag(element.name)
+                # Copy the element with its ID
+                attrs = ""
                 if element.get("id"):
-                    new_elem["id"] = element["id"]
+                    element_id = EntitySubstitution.substitute_xml(element["id"])
+                    attrs = " id=" + EntitySubstitution.quoted_attribute_value(element_id)
 
                 # Add text content
-                text_content = self._extract_text_content(element)
-                if text_content:
-                    new_elem.string = text_content
+                text_content = EntitySubstitution.substitute_xml(self._extract_text_content(element))
 
-                body.append(new_elem)
+                fragments.append(f"<{element.name}{attrs}>{text_content}</{element.name}>")
+        fragments.append("</body>")
+        fragments.append(after_body_end)
 
-        return comp_soup
+        return "".join(fragments)
 
     def _is_text_containing_element(self, element: Tag) -> bool:
         """Check if element contains translatable text.
@@ -185,18 +220,11 @@ class HTMLExtractMergeTool:
             return False
 
         # Skip script, style, and other non-translatable elements
-        if element.name in ["script", "style", "meta", "link", "head", "title"]:
+        if element.name in _NON_TRANSLATABLE_TAGS:
             return False
 
         # Check if element has direct text content (not just child element text)
-        direct_text = ""
-        for content in element.contents:
-            if hasattr(content, "strip") and callable(getattr(content, "strip", None)):
-                text = content.strip()
-                if text:
-                    direct_text += text
-
-        return bool(direct_text)
+        return any(isinstance(content, NavigableString) and content.strip() for content in element.contents)
 
     def _is_translatable_element(self, element: Tag) -> bool:
         """Check if element should be included in subset for translation.
@@ -218,20 +246,18 @@ class HTMLExtractMergeTool:
         Returns:
             Direct text content
         """
-        if hasattr(element, "get_text"):
-            # Get text from immediate children only, not nested elements
-            texts = []
-            for content in element.contents:
-                if hasattr(content, "strip") and callable(getattr(content, "strip", None)):  # NavigableString
-                    text = content.strip()
-                    if text:
-                        texts.append(text)
-                elif hasattr(content, "get_text"):  # Tag
-                    text = content.get_text(separator=" ", strip=True)
-                    if text:
-                        texts.append(text)
-            return " ".join(texts)
-        return str(element).strip()
+        # Get text from immediate children only, not nested elements
+        texts = []
+        for content in element.contents:
+            if isinstance(content, NavigableString):
+                text = content.strip()
+                if text:
+                    texts.append(text)
+            elif isinstance(content, Tag):
+                text = content.get_text(separator=" ", strip=True)
+                if text:
+                    texts.append(text)
+        return " ".join(texts)
 
     def _match_comp_elements(self, edited_soup: BeautifulSoup, original_comp_soup: BeautifulSoup) -> list:
         """Match elements between edited and original subset documents.
@@ -243,24 +269,39 @@ class HTMLExtractMergeTool:
         Returns:
             List of element matches
         """
-        edited_elements = list(edited_soup.find_all())
-        original_elements = list(original_comp_soup.find_all())
+        # Only originals with an ID can be located in the superset. The bare
+        # document skeleton would be fuzzy-scored against the whole text, but a
+        # skeleton tag with an ID is a body or head that was extracted for its
+        # own direct text, so it stays a candidate.
+        edited_elements = [
+            element for element in edited_soup.find_all() if element.name not in _DOCUMENT_TAGS or "id" in element.attrs
+        ]
+        original_elements = original_comp_soup.find_all(id=True)
 
         return self.element_matcher.match_elements(edited_elements, original_elements)
 
-    def _apply_changes_to_superset(self, matches: list, full_soup: BeautifulSoup) -> BeautifulSoup:
+    def _apply_changes_to_superset(
+        self, matches: list, full_soup: BeautifulSoup, id_elements: list[Tag]
+    ) -> BeautifulSoup:
         """Apply matched changes to the superset document.
 
         Args:
             matches: Element matches from subset comparison
             full_soup: Superset document to modify
+            id_elements: Elements of the superset that carry an ID
 
         Returns:
             Modified superset document
         """
         match_by_id: dict[str, tuple[Tag | None, Tag | None, float]] = {}
+        # Edited texts are read both for their own element and as children of
+        # their parent, so each is extracted once; matches keeps the ids stable
+        edited_texts: dict[int, str] = {}
 
         for edited_elem, original_elem, confidence in matches:
+            if edited_elem is not None:
+                edited_texts[id(edited_elem)] = self._extract_text_content(edited_elem)
+
             lookup_id = None
             if original_elem and original_elem.get("id"):
                 lookup_id = original_elem["id"]
@@ -270,23 +311,30 @@ class HTMLExtractMergeTool:
             if lookup_id:
                 match_by_id[lookup_id] = (edited_elem, original_elem, confidence)
 
+        # Index superset elements by ID once instead of scanning the tree per match
+        superset_index: dict[str, Tag] = {}
+        for element in id_elements:
+            superset_index.setdefault(element["id"], element)
+
         for edited_elem, original_elem, confidence in matches:
             if edited_elem and original_elem and confidence >= self.config.simi_level:
                 # Find corresponding element in superset by ID
                 element_id = original_elem.get("id")
                 if element_id:
-                    full_elem = full_soup.find(attrs={"id": element_id})
-                    if full_elem:
+                    full_elem = superset_index.get(element_id)
+                    # Skip elements removed from the tree while applying an earlier match
+                    if full_elem and not full_elem.decomposed:
                         # Update text content while preserving structure and attributes
-                        new_text = self._extract_text_content(edited_elem)
+                        new_text = edited_texts[id(edited_elem)]
 
                         # Preserve existing attributes and structure
                         # Replace only the text content, not the entire element
                         if new_text:
                             # Remove child elements that were dropped or whose text is no longer referenced.
                             if isinstance(full_elem, Tag):
-                                for child in list(full_elem.find_all(recursive=False)):
-                                    if isinstance(child, Tag) and child.get("id"):
+                                new_text_lower = new_text.lower()
+                                for child in [c for c in full_elem.contents if isinstance(c, Tag)]:
+                                    if child.get("id"):
                                         child_id = child["id"]
                                         child_match = match_by_id.get(child_id)
                                         child_old_pacompal_text = self._extract_text_content(child)
@@ -299,7 +347,7 @@ class HTMLExtractMergeTool:
                                         child_removed_in_subset = edited_child is None
                                         child_changed = (
                                             edited_child is not None
-                                            and self._extract_text_content(edited_child) != child_old_pacompal_text
+                                            and edited_texts[id(edited_child)] != child_old_pacompal_text
                                         )
 
                                         # Drop unchanged children whose original text is absent from the new parent text.
@@ -310,16 +358,14 @@ class HTMLExtractMergeTool:
                                         if (
                                             not child_changed
                                             and child_text_lower
-                                            and child_text_lower not in new_text.lower()
+                                            and child_text_lower not in new_text_lower
                                         ):
                                             child.decompose()
                                             continue
 
                             # Clear only text content, keep child elements
                             for content in list(full_elem.contents):
-                                if hasattr(content, "strip") and callable(
-                                    getattr(content, "strip", None)
-                                ):  # It's a NavigableString
+                                if isinstance(content, NavigableString):
                                     content.extract()
 
                             # Add new text at the beginning
@@ -330,17 +376,21 @@ class HTMLExtractMergeTool:
 
         return full_soup
 
-    def _cleanup_generated_ids(self, soup: BeautifulSoup) -> BeautifulSoup:
+    def _cleanup_generated_ids(self, soup: BeautifulSoup, id_elements: list[Tag]) -> BeautifulSoup:
         """Remove generated IDs from the final document.
 
+        Merging only removes elements and rewrites text, so the ID-carrying
+        elements collected before the merge are still the complete set.
+
         Args:
             soup: Document to clean up
+            id_elements: Elements of the document that carried an ID before merging
 
         Returns:
             Document with generated IDs removed
         """
-        for element in soup.find_all(attrs={"id": True}):
-            if self.id_generator.is_generated_id(element["id"]):
+        for element in id_elements:
+            if not element.decomposed and self.id_generator.is_generated_id(element["id"]):
                 del element["id"]
 
         return soup
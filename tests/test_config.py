@@ -1,6 +1,8 @@
 # this_file: tests/test_config.py
 """Tests for ProcessingConfig class."""
 
+from dataclasses import FrozenInstanceError
+
 import pytest
 
 from htmladapt.config import ProcessingConfig
@@ -39,3 +41,12 @@ class TestProcessingConfig:
 
         with pytest.raises(ValueError, match="simi_level must be between 0.0 and 1.0"):
             ProcessingConfig(simi_level=1.1)
+
+    def test_config_is_frozen(self):
+        """Test that configuration cannot be changed after creation."""
+        config = ProcessingConfig()
+
+        with pytest.raises(FrozenInstanceError):
+            config.simi_level = 0.5
+
+        assert hash(config) == hash(ProcessingConfig())
@@ -233,3 +233,60 @@ class TestHTMLExtractMergeTool:
 
         assert "Translated paragraph" in merged, "Translated text should appear in merged output"
         assert "<strong>" not in merged, "Inline markup should be removed when translation drops it"
+
+    def test_bytes_input_round_trip(self):
+        """UTF-8 bytes should be accepted by both extract and merge."""
+        html = "<html><body><p>Café crème</p></body></html>".encode()
+
+        superset, subset = self.tool.extract(html)
+        edited = subset.replace("Café crème", "Kawa")
+        result = self.tool.merge(edited.encode(), subset.encode(), superset.encode(), html)
+
+        assert "Café crème" in subset
+        assert "Kawa" in result
+
+    def test_merge_with_shared_subset_input(self):
+        """Passing the same subset twice should merge like two equal copies."""
+        html = "<html><body><h1>Title</h1><p>First paragraph</p><p>Second <em>part</em></p></body></html>"
+
+        superset, subset = self.tool.extract(html)
+        subset_copy = subset.encode().decode()
+        assert subset_copy is not subset
+
+        expected = self.tool.merge(subset, subset_copy, superset, html)
+
+        assert self.tool.merge(subset, subset, superset, html) == expected
+        encoded = subset.encode()
+        assert self.tool.merge(encoded, encoded, superset.encode(), html) == expected
+
+    def test_body_level_text_round_trip(self):
+        """Text placed directly in <body> should be extracted and its translation merged back."""
+        self.tool.parser._preferred_parsers = ["html.parser"]
+        html = "<html><body>Hello world<p>Para one</p></body></html>"
+
+        superset, subset = self.tool.extract(html)
+        merged = self.tool.merge(subset.replace("Hello world", "Hola mundo"), subset, superset, html)
+
+        assert "Hello world" in subset
+        assert "Hola mundo" in merged
+        assert "Hello world" not in merged
+
+    def test_subset_escapes_markup_characters(self):
+        """Subset text and IDs with markup characters should be escaped as BeautifulSoup would."""
+        html = (
+            """<html><body><p id='a&amp;b"c&lt;d&gt;'>Tom &amp; Jerry &lt;3 &gt; "quoted"</p>"""
+            "<div>x &lt; y</div></body></html>"
+        )
+
+        _superset, subset = self.tool.extract(html)
+
+        assert (
+            """<p id='a&amp;b"c&lt;d&gt;'>Tom &amp; Jerry &lt;3 &gt; "quoted"</p><div id="xhqdiv_0">x &lt; y</div>"""
+            in subset
+        )
+
+        reparsed = self.tool.parser.parse(subset)
+        assert str(reparsed) == subset
+        assert reparsed.find("p")["id"] == 'a&b"c<d>'
+        assert reparsed.find("p").get_text() == 'Tom & Jerry <3 > "quoted"'
+        assert reparsed.find("div").get_text() == "x < y"
@@ -52,6 +52,13 @@ class TestIDGenerator:
         generated_ids = [self.generator.generate_id() for _ in range(50)]
         assert existing_id not in generated_ids
 
+    def test_register_existing_ids(self):
+        """Test registering several existing IDs at once."""
+        self.generator.register_existing_ids(["xhq0", "xhq1"])
+
+        assert self.generator.generate_id() == "xhq2"
+        assert self.generator.stats["used_ids_count"] == 3
+
     def test_is_generated_id(self):
         """Test checking if ID was generated."""
         generated_id = self.generator.generate_id()
@@ -0,0 +1,131 @@
+# this_file: tests/test_matcher.py
+"""Tests for ElementMatcher class."""
+
+from bs4 import BeautifulSoup
+
+from htmladapt.matcher import ElementMatcher
+
+
+def _elements(html):
+    """Parse HTML and return its paragraph elements."""
+    return BeautifulSoup(html, "html.parser").find_all("p")
+
+
+class TestElementMatcher:
+    """Test ElementMatcher functionality."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.matcher = ElementMatcher(simi_level=0.7)
+
+    def test_id_match(self):
+        """Elements sharing an ID should match with full confidence."""
+        edited = _elements('<p id="a">Completely different</p>')
+        original = _elements('<p id="b">Other</p><p id="a">Original text</p>')
+
+        matches = self.matcher.match_elements(edited, original)
+
+        assert matches[0] == (edited[0], original[1], 1.0)
+        assert matches[1] == (None, original[0], 0.0)
+
+    def test_hash_match(self):
+        """Identical elements without IDs should match by content hash."""
+        edited = _elements("<p>Same text</p>")
+        original = _elements("<p>Other text entirely</p><p>Same text</p>")
+
+        matches = self.matcher.match_elements(edited, original)
+
+        assert matches[0] == (edited[0], original[1], 0.95)
+
+    def test_fuzzy_match(self):
+        """Similar text should match above the similarity threshold."""
+        edited = _elements("<p>The quick brown fox jumps</p>")
+        original = _elements("<p>Unrelated words here</p><p>The quick brown fox jumped</p>")
+
+        matches = self.matcher.match_elements(edited, original)
+
+        edited_elem, original_elem, score = matches[0]
+        assert edited_elem is edited[0]
+        assert original_elem is original[1]
+        assert 0.7 <= score < 1.0
+
+    def test_no_match_below_threshold(self):
+        """Dissimilar elements should stay unmatched."""
+        edited = _elements("<p>Alpha beta gamma</p>")
+        original = _elements("<p>Something else</p>")
+
+        matches = self.matcher.match_elements(edited, original)
+
+        assert matches == [(edited[0], None, 0.0), (None, original[0], 0.0)]
+
+    def test_original_used_once(self):
+        """An original element should be matched at most once."""
+        edited = _elements("<p>Repeated</p><p>Repeated</p>")
+        original = _elements("<p>Repeated</p>")
+
+        matches = self.matcher.match_elements(edited, original)
+
+        assert matches[0][1] is original[0]
+        assert matches[1] == (edited[1], None, 0.0)
+        assert len(matches) == 2
+
+    def test_exact_matches_take_priority(self):
+        """A fuzzy match must not claim an original that another element matches by ID."""
+        edited = _elements('<p>Introduction text one</p><p id="a">Introduction text two</p>')
+        original = _elements('<p id="a">Introduction text two</p>')
+
+        matches = self.matcher.match_elements(edited, original)
+
+        assert matches[0] == (edited[0], None, 0.0)
+        assert matches[1] == (edited[1], original[0], 1.0)
+
+    def test_fuzzy_match_without_rapidfuzz(self, monkeypatch):
+        """The word-overlap fallback should be used when rapidfuzz is unavailable."""
+        monkeypatch.setattr("htmladapt.matcher.process", None)
+        edited = _elements("<p>one two three four five</p>")
+        original = _elements("<p>one two three four five six</p>")
+
+        matches = self.matcher.match_elements(edited, original)
+
+        assert matches[0][1] is original[0]
+        assert matches[0][2] == 5 / 6
+
+    def test_fuzzy_assignment_maximizes_total_similarity(self):
+        """Fuzzy matches should not let an earlier element take a later one's best original."""
+        edited = _elements("<p>abcdefghij</p><p>abcdefgxyz</p>")
+        original = _elements("<p>abcdefghxy</p><p>qqcdefghij</p>")
+        matcher = ElementMatcher(simi_level=0.6)
+
+        matches = matcher.match_elements(edited, original)
+
+        assert matches[0][1] is original[1]
+        assert matches[1][1] is original[0]
+
+    def test_repeated_content_matches_in_order(self):
+        """Identical elements should pair with identical originals in document order."""
+        edited = _elements("<p>Same</p><p>Same</p>")
+        original = _elements("<p>Same</p><p>Other text</p><p>Same</p>")
+
+        matches = self.matcher.match_elements(edited, original)
+
+        assert matches[0] == (edited[0], original[0], 0.95)
+        assert matches[1] == (edited[1], original[2], 0.95)
+
+    def test_fuzzy_match_repeated_texts(self):
+        """Repeated edited texts should each get their own fuzzy match."""
+        edited = _elements("<p>Read more now</p><p>Read more now</p>")
+        original = _elements("<p>Read more here</p><p>Read more here</p>")
+
+        matches = self.matcher.match_elements(edited, original)
+
+        assert {id(matches[0][1]), id(matches[1][1])} == {id(original[0]), id(original[1])}
+        assert len(matches) == 2
+
+    def test_unchanged_text_matches_despite_attributes(self):
+        """Elements with identical text should match even if their attributes differ."""
+        edited = _elements('<p class="new">Same words here</p>')
+        original = _elements('<p id="x">Other words</p><p class="old">Same words here</p>')
+
+        matches = self.matcher.match_elements(edited, original)
+
+        assert matches[0] == (edited[0], original[1], 1.0)
@@ -2,6 +2,7 @@
 """Tests for HTMLParser class."""
 
 import pytest
+from bs4.builder import builder_registry
 
 from htmladapt.parser import HTMLParser
 
@@ -57,3 +58,46 @@ class TestHTMLParser:
 
         assert hasattr(clone, "_htmladapt_parser")
         assert clone.find("p").get_text() == "Clone"
+
+    def test_bytes_input_with_legacy_encoding(self):
+        """Bytes in a non-UTF-8 encoding should decode using the given encoding."""
+        html_bytes = "<html><body><p>Café</p></body></html>".encode("latin-1")
+        soup = self.parser.parse(html_bytes, encoding="latin-1")
+
+        assert soup.find("p").get_text() == "Café"
+
+    def test_clone_is_independent(self):
+        """Changes to a clone should not affect the original soup."""
+        soup = self.parser.parse('<html><body><p id="a">Clone</p></body></html>')
+        clone = self.parser.clone_soup(soup)
+        clone.find("p")["id"] = "b"
+
+        assert soup.find("p")["id"] == "a"
+        assert clone._htmladapt_parser == soup._htmladapt_parser
+
+    def test_missing_parser_is_skipped(self, monkeypatch):
+        """A parser that is not installed should be left out of the preference list."""
+        lookup = builder_registry.lookup
+        monkeypatch.setattr(builder_registry, "lookup", lambda name: None if name == "lxml" else lookup(name))
+        parser = HTMLParser()
+        soup = parser.parse("<p>Fallback</p>")
+
+        assert "lxml" not in parser._preferred_parsers
+        assert soup._htmladapt_parser == parser._preferred_parsers[0]
+
+    def test_bytes_input_with_utf16_bom(self):
+        """Bytes starting with a UTF-16 byte-order mark should decode without an explicit encoding."""
+        html_bytes = "<html><body><p>Café</p></body></html>".encode("utf-16")
+        soup = self.parser.parse(html_bytes)
+
+        assert soup.find("p").get_text() == "Café"
+
+    def test_bytes_input_invalid_utf8_is_rejected(self):
+        """Undecodable bytes without a byte-order mark or encoding should fail rather than be altered."""
+        html_bytes = "<p>Café</p>".encode("latin-1")
+
+        with pytest.raises(ValueError, match="not valid UTF-8"):
+            self.parser.parse(html_bytes)
+
+        soup = self.parser.parse(html_bytes, encoding="latin-1")
+        assert soup.find("p").get_text() == "Café"